@@ -84,6 +84,36 @@ pub fn count_prose_words(content: &str) -> u32 {
         .count() as u32
 }
 
+/// Count prose words in the file at `path` without holding it in memory.
+/// Streams line by line through one reused buffer, applying the same rules as
+/// `count_prose_words`. Returns 0 when the file does not exist.
+/// Use this when only the count is needed — Full_Book.md grows to the full manuscript.
+pub(crate) fn count_prose_words_in_file(path: &Path) -> Result<u32> {
+    use std::io::BufRead;
+
+    let file = match std::fs::File::open(path) {
+        Ok(f) => f,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(0),
+        Err(e) => {
+            return Err(e).with_context(|| format!("Failed to open {}", path.display()));
+        }
+    };
+    let mut reader = std::io::BufReader::with_capacity(64 * 1024, file);
+    let mut line = String::new();
+    let mut total: u32 = 0;
+    loop {
+        line.clear();
+        let n = reader
+            .read_line(&mut line)
+            .with_context(|| format!("Failed to read {}", path.display()))?;
+        if n == 0 {
+            break;
+        }
+        total += count_prose_words(&line);
+    }
+    Ok(total)
+}
+
 // ─── Pagination ────────────────────────────────────────────────────────────────
 
 /// Insert `<!-- PAGE N -->` markers into `new_content` at paragraph boundaries
@@ -106,13 +136,9 @@ fn insert_pagination(start_word_count: u32, new_content: &str, words_per_page: u
         if para.is_empty() {
             continue;
         }
-        // Count words the same way as count_prose_words — skip HTML comment lines so
-        // that `cumulative` never drifts from the book's true prose word count.
-        let para_words = para
-            .lines()
-            .filter(|l| !l.trim_start().starts_with("<!--"))
-            .flat_map(|l| l.split_whitespace())
-            .count() as u32;
+        // Same counter as the rest of the book — skips HTML comment lines so that
+        // `cumulative` never drifts from the book's true prose word count.
+        let para_words = count_prose_words(para);
 
         // Insert marker(s) for every boundary this paragraph starts at, crosses, or lands on
         while cumulative <= next_mark && cumulative + para_words >= next_mark {
@@ -157,7 +183,9 @@ pub(crate) fn append_to_full_book(
         book.push('\n');
     }
 
-    let new_words = count_prose_words(&book);
+    // The appended block starts on its own line, so its words simply add to the
+    // existing total — no need to recount the whole manuscript.
+    let new_words = old_words + count_prose_words(&paginated);
     std::fs::write(book_path, &book).with_context(|| "Failed to write Full_Book.md")?;
     Ok((old_words, new_words))
 }
@@ -166,7 +194,11 @@ pub(crate) fn append_to_full_book(
 
 /// Scan `Full_Book.md` for structural issues without loading full prose into context.
 /// Returns `None` if the book passes all checks, or `Some(needs_formatting JSON)` if issues found.
-pub(crate) fn check_full_book_format(repo: &Path) -> Result<Option<serde_json::Value>> {
+/// Takes the caller's already-parsed `Config` so Config.yml is read once per command.
+pub(crate) fn check_full_book_format(
+    repo: &Path,
+    config: &Config,
+) -> Result<Option<serde_json::Value>> {
     let book_path = repo.join("Current version").join("Full_Book.md");
 
     // Nothing to check if Full_Book.md doesn't exist yet
@@ -174,7 +206,6 @@ pub(crate) fn check_full_book_format(repo: &Path) -> Result<Option<serde_json::V
         return Ok(None);
     }
 
-    let config = Config::load(repo)?;
     let state = InkState::load(repo).unwrap_or_default();
 
     let content = std::fs::read_to_string(&book_path)
@@ -368,11 +399,11 @@ pub fn apply_format_patch(repo: &Path, patch: serde_json::Value) -> Result<serde
     std::fs::write(&book_path, &content).with_context(|| "Failed to write patched Full_Book.md")?;
 
     // Commit and push
-    git::run_git(repo, &["add", "Current version/Full_Book.md"])
+    git::run_git_quiet(repo, &["add", "Current version/Full_Book.md"])
         .with_context(|| "Failed to git add Full_Book.md")?;
-    git::run_git(repo, &["commit", "-m", "fmt: apply format corrections"])
+    git::run_git_quiet(repo, &["commit", "-m", "fmt: apply format corrections"])
         .with_context(|| "Failed to commit format corrections")?;
-    git::run_git(repo, &["push", "origin", "main"])
+    git::run_git_quiet(repo, &["push", "origin", "main"])
         .with_context(|| "Failed to push format corrections")?;
 
     Ok(serde_json::json!({
@@ -399,6 +430,40 @@ mod tests {
         assert_eq!(count_prose_words(""), 0);
     }
 
+    #[test]
+    fn count_words_in_file_matches_in_memory_count() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("Full_Book.md");
+        let content = "<!-- header -->\nOne two three\r\n\n<!-- PAGE 2 -->\nfour  five\nsix";
+        std::fs::write(&path, content).unwrap();
+        assert_eq!(
+            count_prose_words_in_file(&path).unwrap(),
+            count_prose_words(content)
+        );
+        assert_eq!(count_prose_words_in_file(&path).unwrap(), 6);
+    }
+
+    #[test]
+    fn count_words_in_missing_file_is_zero() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("Full_Book.md");
+        assert_eq!(count_prose_words_in_file(&path).unwrap(), 0);
+    }
+
+    #[test]
+    fn append_to_full_book_totals_match_recount() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("Full_Book.md");
+        std::fs::write(&path, "<!-- header -->\nOne two three").unwrap();
+
+        let para = "word ".repeat(260);
+        let (old_words, new_words) = append_to_full_book(&path, para.trim(), 250).unwrap();
+        let written = std::fs::read_to_string(&path).unwrap();
+        assert_eq!(old_words, 3);
+        assert_eq!(new_words, count_prose_words(&written));
+        assert_eq!(new_words, 263);
+    }
+
     #[test]
     fn strip_engine_markers_removes_start_end_lines() {
         let content = "Before\n<!-- INK:NEW:START -->\nNew prose\n<!-- INK:NEW:END -->\nAfter";
@@ -534,7 +599,8 @@ Old prose here.
         )
         .unwrap();
 
-        let result = check_full_book_format(tmp.path()).unwrap();
+        let config = Config::load(tmp.path()).unwrap();
+        let result = check_full_book_format(tmp.path(), &config).unwrap();
         let json = result.expect("should return format issues");
         let issues = json["format_issues"].as_array().unwrap();
         assert!(
@@ -560,7 +626,8 @@ Old prose here.
         );
         std::fs::write(book_dir.join("Full_Book.md"), content).unwrap();
 
-        let result = check_full_book_format(tmp.path()).unwrap();
+        let config = Config::load(tmp.path()).unwrap();
+        let result = check_full_book_format(tmp.path(), &config).unwrap();
         assert!(result.is_none(), "clean book should return None");
     }
 }
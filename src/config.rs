@@ -6,11 +6,11 @@ fn default_language() -> String {
     "English".to_string()
 }
 
-fn default_summary_context_entries() -> usize {
+pub(crate) fn default_summary_context_entries() -> usize {
     5
 }
 
-fn default_session_timeout_minutes() -> i64 {
+pub(crate) fn default_session_timeout_minutes() -> i64 {
     60
 }
 
@@ -18,7 +18,7 @@ fn default_words_per_page() -> u32 {
     250
 }
 
-fn default_words_per_chapter() -> u32 {
+pub(crate) fn default_words_per_chapter() -> u32 {
     3000
 }
 
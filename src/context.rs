@@ -6,7 +6,7 @@ use std::path::Path;
 use std::sync::OnceLock;
 use tracing::{info, warn};
 
-use crate::config::Config;
+use crate::config::{default_summary_context_entries, default_words_per_chapter, Config};
 use crate::git;
 use crate::state::InkState;
 
@@ -24,16 +24,15 @@ pub(crate) fn ink_re() -> &'static Regex {
 /// Char-based (not byte-based) to avoid panics on multi-byte UTF-8.
 pub(crate) fn extract_anchor(text: &str, match_start: usize) -> String {
     let preceding = text[..match_start].trim_end();
-    preceding
-        .chars()
+    // Byte offset of the 200th char from the end — slice once instead of collecting
+    // the reversed chars into a String and reversing that into another.
+    let start = preceding
+        .char_indices()
         .rev()
-        .take(200)
-        .collect::<String>()
-        .chars()
-        .rev()
-        .collect::<String>()
-        .trim()
-        .to_string()
+        .nth(199)
+        .map(|(i, _)| i)
+        .unwrap_or(0);
+    preceding[start..].trim().to_string()
 }
 
 // ─── Output types ────────────────────────────────────────────────────────────
@@ -143,11 +142,11 @@ pub fn create_lock(repo: &Path) -> Result<()> {
     let now = Utc::now().to_rfc3339();
     std::fs::write(lock_path(repo), &now).with_context(|| "Failed to write .ink-running")?;
 
-    git::run_git(repo, &["add", ".ink-running"])
+    git::run_git_quiet(repo, &["add", ".ink-running"])
         .with_context(|| "Failed to git add .ink-running")?;
-    git::run_git(repo, &["commit", "-m", "chore: open session lock"])
+    git::run_git_quiet(repo, &["commit", "-m", "chore: open session lock"])
         .with_context(|| "Failed to commit .ink-running")?;
-    git::run_git(repo, &["push", "origin", "main"])
+    git::run_git_quiet(repo, &["push", "origin", "main"])
         .with_context(|| "Failed to push .ink-running")?;
 
     info!("Session lock created at {}", now);
@@ -170,10 +169,11 @@ pub fn remove_stale_lock(repo: &Path) -> Result<()> {
 
 /// Removes .ink-kill via git rm, commits, and pushes.
 pub fn delete_kill_file(repo: &Path) -> Result<()> {
-    git::run_git(repo, &["rm", "-f", ".ink-kill"]).with_context(|| "Failed to git rm .ink-kill")?;
-    git::run_git(repo, &["commit", "-m", "chore: acknowledge kill request"])
+    git::run_git_quiet(repo, &["rm", "-f", ".ink-kill"])
+        .with_context(|| "Failed to git rm .ink-kill")?;
+    git::run_git_quiet(repo, &["commit", "-m", "chore: acknowledge kill request"])
         .with_context(|| "Failed to commit kill acknowledgement")?;
-    git::run_git(repo, &["push", "origin", "main"])
+    git::run_git_quiet(repo, &["push", "origin", "main"])
         .with_context(|| "Failed to push kill acknowledgement")?;
     info!("Kill file removed");
     Ok(())
@@ -181,6 +181,17 @@ pub fn delete_kill_file(repo: &Path) -> Result<()> {
 
 // ─── Loading helpers ──────────────────────────────────────────────────────────
 
+/// Read `path` into a String, returning `Ok(None)` when the file does not exist.
+/// The payload files live at fixed paths, so a single open replaces the
+/// `exists()` probe + read pair (one syscall round-trip per file instead of two).
+pub(crate) fn read_optional(path: &Path) -> std::io::Result<Option<String>> {
+    match std::fs::read_to_string(path) {
+        Ok(content) => Ok(Some(content)),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(None),
+        Err(e) => Err(e),
+    }
+}
+
 pub fn load_global_material(repo: &Path, summary_entries: usize) -> Result<Vec<FileContent>> {
     let global_dir = repo.join("Global Material");
     let mut files: Vec<FileContent> = std::fs::read_dir(&global_dir)
@@ -191,18 +202,18 @@ pub fn load_global_material(repo: &Path, summary_entries: usize) -> Result<Vec<F
             )
         })?
         .filter_map(|e| e.ok())
+        // DirEntry::file_type() and file_name() come from the directory read itself —
+        // no extra stat and no PathBuf is built for entries that are skipped.
         .filter(|e| e.file_type().map(|t| t.is_file()).unwrap_or(false))
         .map(|e| -> Result<Option<FileContent>> {
-            let path = e.path();
-            let filename = match path.file_name() {
-                Some(n) => n.to_string_lossy().to_string(),
-                None => return Ok(None),
-            };
-            // Skip Config.yml — it's surfaced separately
-            if filename == "Config.yml" {
+            let filename = e.file_name().to_string_lossy().into_owned();
+            // Skip Config.yml — it's surfaced separately. Hidden entries (.DS_Store,
+            // editor swap files) are skipped too: they are not context and are often
+            // not valid UTF-8, which would abort the whole session-open.
+            if filename == "Config.yml" || filename.starts_with('.') {
                 return Ok(None);
             }
-            let mut content = std::fs::read_to_string(&path)
+            let mut content = std::fs::read_to_string(e.path())
                 .with_context(|| format!("Failed to read Global Material/{}", filename))?;
             if filename == "Summary.md" {
                 content = truncate_summary(&content, summary_entries);
@@ -230,10 +241,15 @@ pub fn truncate_summary(text: &str, n: usize) -> String {
         .filter(|p| !p.is_empty())
         .collect();
 
-    // Prefer substantive paragraphs; fall back to all if none qualify
+    // Prefer substantive paragraphs; fall back to all if none qualify.
+    // `nth` stops scanning once the threshold is reached instead of counting every word.
     let substantive: Vec<&str> = all
         .iter()
-        .filter(|p| p.split_whitespace().count() >= MIN_SUMMARY_PARAGRAPH_WORDS)
+        .filter(|p| {
+            p.split_whitespace()
+                .nth(MIN_SUMMARY_PARAGRAPH_WORDS - 1)
+                .is_some()
+        })
         .copied()
         .collect();
 
@@ -279,16 +295,15 @@ pub fn load_chapter(repo: &Path, num: u32, human_edits: &[String]) -> Result<Opt
     let relative = format!("Chapters material/Chapter_{:02}.md", num);
     let path = repo.join(&relative);
 
-    if !path.exists() {
+    let Some(content) =
+        read_optional(&path).with_context(|| format!("Failed to read chapter {}", num))?
+    else {
         return Ok(None);
-    }
+    };
 
-    let content = std::fs::read_to_string(&path)
-        .with_context(|| format!("Failed to read chapter {}", num))?;
-
-    let modified_today = human_edits
-        .iter()
-        .any(|f| f.contains(&format!("Chapter_{:02}.md", num)));
+    // Build the filename once rather than formatting it for every human edit.
+    let filename = format!("Chapter_{:02}.md", num);
+    let modified_today = human_edits.iter().any(|f| f.contains(&filename));
 
     Ok(Some(ChapterInfo {
         path: relative,
@@ -323,18 +338,9 @@ pub fn extract_ink_instructions(text: &str) -> (String, Vec<Instruction>) {
 pub fn load_word_count(repo: &Path, target: u32) -> Result<WordCount> {
     let path = repo.join("Current version").join("Full_Book.md");
 
-    if !path.exists() {
-        return Ok(WordCount {
-            total: 0,
-            target,
-            remaining: target,
-        });
-    }
-
-    let content = std::fs::read_to_string(&path).with_context(|| "Failed to read Full_Book.md")?;
-
-    // Use the same counter as session-close so both modules always agree.
-    let total = crate::book::count_prose_words(&content);
+    // Only the count is needed here, so stream the manuscript instead of reading it whole.
+    // Same counting rules as session-close so both modules always agree.
+    let total = crate::book::count_prose_words_in_file(&path)?;
     let remaining = target.saturating_sub(total);
 
     Ok(WordCount {
@@ -359,7 +365,7 @@ pub fn session_open(repo: &Path) -> Result<SessionPayload> {
         info!("Kill file detected — acknowledging and aborting");
         // Stage the lock removal via git so it is included in the kill commit and pushed.
         // --ignore-unmatch avoids a failure when no lock exists.
-        git::run_git(repo, &["rm", "--ignore-unmatch", ".ink-running"])
+        git::run_git_quiet(repo, &["rm", "--ignore-unmatch", ".ink-running"])
             .with_context(|| "Failed to git rm .ink-running on kill")?;
         delete_kill_file(repo)?;
 
@@ -374,8 +380,8 @@ pub fn session_open(repo: &Path) -> Result<SessionPayload> {
                 chapter_count: 0,
                 chapter_structure: String::new(),
                 words_per_session: 0,
-                summary_context_entries: 5,
-                words_per_chapter: 3000,
+                summary_context_entries: default_summary_context_entries(),
+                words_per_chapter: default_words_per_chapter(),
                 current_chapter: 1,
             },
             global_material: vec![],
@@ -414,8 +420,10 @@ pub fn session_open(repo: &Path) -> Result<SessionPayload> {
     //    and committed before the ff-merge can overwrite them.
     //
     //    Two complementary methods — union:
-    //    a) git status --short   → uncommitted working-tree changes vs HEAD
-    //    b) git diff origin/main → ALL diffs between local tree and remote,
+    //    a) git status --porcelain=v1 -z --untracked-files=all
+    //       → uncommitted working-tree changes vs HEAD; untracked files are listed
+    //         individually (never collapsed to `dir/`)
+    //    b) git diff -z origin/main → ALL diffs between local tree and remote,
     //       catching edits made when local HEAD was already behind origin
     info!("Step 4: collecting human edits (local working tree + diff vs origin)");
     let mut human_edits = git::collect_modified_files(repo)?;
@@ -520,11 +528,9 @@ pub fn session_open(repo: &Path) -> Result<SessionPayload> {
     // 14. Read current.md + extract INK instructions
     info!("Step 14: loading current review");
     let review_path = repo.join("Review").join("current.md");
-    let raw_review = if review_path.exists() {
-        std::fs::read_to_string(&review_path).with_context(|| "Failed to read Review/current.md")?
-    } else {
-        String::new()
-    };
+    let raw_review = read_optional(&review_path)
+        .with_context(|| "Failed to read Review/current.md")?
+        .unwrap_or_default();
     let (mut stripped_review, instructions) = extract_ink_instructions(&raw_review);
 
     // 14b. Truncate the rolling window to stay within the model's context budget.
@@ -593,3 +599,35 @@ pub fn session_open(repo: &Path) -> Result<SessionPayload> {
         session_type,
     })
 }
+
+// ─── Tests ────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn global_material_skips_config_and_hidden_files() {
+        let tmp = tempfile::tempdir().unwrap();
+        let global_dir = tmp.path().join("Global Material");
+        std::fs::create_dir_all(global_dir.join(".git")).unwrap();
+        std::fs::write(global_dir.join("Config.yml"), "target_length: 1\n").unwrap();
+        std::fs::write(global_dir.join(".DS_Store"), [0xffu8, 0xfe, 0x00]).unwrap();
+        std::fs::write(global_dir.join("Soul.md"), "Voice").unwrap();
+        std::fs::write(global_dir.join("Lore.md"), "World").unwrap();
+
+        let files = load_global_material(tmp.path(), 5).unwrap();
+        let names: Vec<&str> = files.iter().map(|f| f.filename.as_str()).collect();
+        assert_eq!(names, vec!["Lore.md", "Soul.md"]);
+    }
+
+    #[test]
+    fn truncate_summary_threshold_is_inclusive() {
+        let short = "word ".repeat(MIN_SUMMARY_PARAGRAPH_WORDS - 1);
+        let exact = "prose ".repeat(MIN_SUMMARY_PARAGRAPH_WORDS);
+        let text = format!("{}\n\n{}\n\n{}", exact.trim(), short.trim(), exact.trim());
+        let result = truncate_summary(&text, 5);
+        assert!(!result.contains("word"), "short paragraph must be filtered");
+        assert_eq!(result.split("\n\n").count(), 2);
+    }
+}
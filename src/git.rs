@@ -1,18 +1,40 @@
 use anyhow::{bail, Context, Result};
 use chrono::Local;
 use std::path::Path;
-use std::process::Command;
+use std::process::{Command, Output, Stdio};
 use tracing::{info, warn};
 
 pub fn run_git(repo: &Path, args: &[&str]) -> Result<String> {
+    run_git_raw(repo, args).map(|out| out.trim().to_string())
+}
+
+/// Like `run_git`, but returns stdout untrimmed. Required for `-z` output, where
+/// records are NUL-terminated and leading spaces are significant.
+pub fn run_git_raw(repo: &Path, args: &[&str]) -> Result<String> {
+    let output = run_git_output(repo, args, Stdio::piped())?;
+    Ok(String::from_utf8_lossy(&output.stdout).into_owned())
+}
+
+/// Like `run_git`, for commands whose stdout is never read (add, commit, push, fetch…).
+/// stdout goes to /dev/null instead of being buffered and UTF-8 decoded; stderr is
+/// still captured so failures carry git's own message.
+pub fn run_git_quiet(repo: &Path, args: &[&str]) -> Result<()> {
+    run_git_output(repo, args, Stdio::null()).map(|_| ())
+}
+
+/// Spawn git with the given stdout handling and fail with git's stderr on a
+/// non-zero exit. Shared by `run_git_raw` and `run_git_quiet`.
+fn run_git_output(repo: &Path, args: &[&str], stdout: Stdio) -> Result<Output> {
     let output = Command::new("git")
         .args(args)
         .current_dir(repo)
+        .stdout(stdout)
+        .stderr(Stdio::piped())
         .output()
         .with_context(|| format!("Failed to spawn git with args: {:?}", args))?;
 
     if output.status.success() {
-        Ok(String::from_utf8_lossy(&output.stdout).trim().to_string())
+        Ok(output)
     } else {
         let stderr = String::from_utf8_lossy(&output.stderr).trim().to_string();
         bail!("git {:?} failed: {}", args, stderr)
@@ -21,12 +43,24 @@ pub fn run_git(repo: &Path, args: &[&str]) -> Result<String> {
 
 /// Fetch remote state and switch to main. Does NOT merge — call
 /// `merge_ff_origin_main` separately after human edits are committed.
+///
+/// Only origin/main is fetched: it is the sole remote-tracking ref the session
+/// reads (human-edit diff + ff-merge), and draft is always force-reset locally from
+/// main, so pulling every remote branch is wasted transfer.
 pub fn preflight_fetch_and_checkout(repo: &Path) -> Result<()> {
-    info!("Fetching origin...");
-    run_git(repo, &["fetch", "origin"]).with_context(|| "Failed to fetch from origin")?;
+    info!("Fetching origin/main...");
+    run_git_quiet(
+        repo,
+        &[
+            "fetch",
+            "origin",
+            "+refs/heads/main:refs/remotes/origin/main",
+        ],
+    )
+    .with_context(|| "Failed to fetch main from origin")?;
 
     info!("Checking out main...");
-    run_git(repo, &["checkout", "main"]).with_context(|| "Failed to checkout main")?;
+    run_git_quiet(repo, &["checkout", "main"]).with_context(|| "Failed to checkout main")?;
 
     Ok(())
 }
@@ -35,7 +69,7 @@ pub fn preflight_fetch_and_checkout(repo: &Path) -> Result<()> {
 /// are committed so the merge cannot overwrite uncommitted local changes.
 pub fn merge_ff_origin_main(repo: &Path) -> Result<()> {
     info!("Fast-forward merging origin/main...");
-    run_git(repo, &["merge", "--ff-only", "origin/main"])
+    run_git_quiet(repo, &["merge", "--ff-only", "origin/main"])
         .with_context(|| "Failed to merge origin/main (non-fast-forward?)")?;
     Ok(())
 }
@@ -43,39 +77,51 @@ pub fn merge_ff_origin_main(repo: &Path) -> Result<()> {
 /// Returns files that differ between the local working tree and origin/main.
 /// This catches IDE saves that were never committed/pushed — the diff between
 /// what the user has locally and what the remote last committed.
+///
+/// `-z` makes git emit NUL-terminated paths verbatim: without it, names with
+/// non-ASCII characters come back C-quoted (`"Chapters material/\303\251..."`)
+/// and never match the paths used elsewhere in the payload.
 pub fn collect_diffs_vs_remote(repo: &Path) -> Result<Vec<String>> {
-    match run_git(repo, &["diff", "origin/main", "--name-only"]) {
+    match run_git_raw(repo, &["diff", "-z", "--name-only", "origin/main"]) {
         Ok(output) => Ok(output
-            .lines()
-            .map(|l| l.trim().to_string())
-            .filter(|l| !l.is_empty())
+            .split('\0')
+            .filter(|p| !p.is_empty())
+            .map(str::to_string)
             .collect()),
         Err(_) => Ok(vec![]), // origin/main may not exist on a fresh local repo
     }
 }
 
+/// Files changed in the working tree or index relative to HEAD, including
+/// untracked files (listed individually, not collapsed to their directory).
 pub fn collect_modified_files(repo: &Path) -> Result<Vec<String>> {
-    let output = run_git(repo, &["status", "--short"])?;
-    let files: Vec<String> = output
-        .lines()
-        .filter_map(|line| {
-            // git status --short format: "XY filename" (2-char status + space + path).
-            // Use .get() to avoid panic on multi-byte UTF-8 characters.
-            let raw = line.get(3..)?.trim().to_string();
-            if raw.is_empty() {
-                return None;
-            }
-            // For renames/copies ("R old -> new"), extract the destination path.
-            if let Some(arrow_pos) = raw.find(" -> ") {
-                let dest = raw[arrow_pos + 4..].trim().to_string();
-                if !dest.is_empty() {
-                    return Some(dest);
-                }
-            }
-            Some(raw)
-        })
-        .collect();
-    Ok(files)
+    let output = run_git_raw(
+        repo,
+        &["status", "--porcelain=v1", "-z", "--untracked-files=all"],
+    )?;
+    Ok(parse_porcelain_z(&output))
+}
+
+/// Parse `git status --porcelain=v1 -z` output into the list of changed paths.
+/// Records are `XY <path>` terminated by NUL, with paths unquoted. Renames and
+/// copies are followed by an extra record holding the source path, which is skipped
+/// so only the destination is reported.
+fn parse_porcelain_z(output: &str) -> Vec<String> {
+    let mut files = Vec::new();
+    let mut records = output.split('\0');
+    while let Some(record) = records.next() {
+        // Use .get() to avoid panic on a short or multi-byte record.
+        let (Some(status), Some(path)) = (record.get(..2), record.get(3..)) else {
+            continue;
+        };
+        if status.contains(['R', 'C']) {
+            records.next(); // source path of the rename/copy
+        }
+        if !path.is_empty() {
+            files.push(path.to_string());
+        }
+    }
+    files
 }
 
 pub fn commit_human_edits(repo: &Path, files: &[String]) -> Result<()> {
@@ -85,20 +131,20 @@ pub fn commit_human_edits(repo: &Path, files: &[String]) -> Result<()> {
 
     info!("Committing {} human-edited file(s)...", files.len());
 
-    run_git(repo, &["add", "."]).with_context(|| "Failed to git add")?;
+    run_git_quiet(repo, &["add", "."]).with_context(|| "Failed to git add")?;
 
     // `git diff --cached --quiet` exits 0 when nothing is staged, 1 when
     // there are staged changes. The human_edits list may contain files from
     // collect_diffs_vs_remote that reflect remote-ahead commits rather than
     // actual local edits — in that case the working tree is clean and there
     // is nothing to commit.
-    let nothing_staged = run_git(repo, &["diff", "--cached", "--quiet"]).is_ok();
+    let nothing_staged = run_git_quiet(repo, &["diff", "--cached", "--quiet"]).is_ok();
     if nothing_staged {
         info!("Nothing staged after git add — skipping commit (working tree already clean)");
         return Ok(());
     }
 
-    run_git(repo, &["commit", "-m", "chore: human updates"])
+    run_git_quiet(repo, &["commit", "-m", "chore: human updates"])
         .with_context(|| "Failed to commit human edits")?;
 
     // No push here — push_tags (called later in session_open) carries this
@@ -109,7 +155,7 @@ pub fn commit_human_edits(repo: &Path, files: &[String]) -> Result<()> {
 pub fn create_snapshot_tag(repo: &Path) -> Result<String> {
     let tag = format!("ink-{}", Local::now().format("%Y-%m-%d-%H-%M-%S"));
 
-    match run_git(repo, &["tag", &tag]) {
+    match run_git_quiet(repo, &["tag", &tag]) {
         Ok(_) => {
             info!("Created snapshot tag: {}", tag);
         }
@@ -123,7 +169,7 @@ pub fn create_snapshot_tag(repo: &Path) -> Result<String> {
 }
 
 pub fn push_tags(repo: &Path) -> Result<()> {
-    run_git(repo, &["push", "origin", "main", "--tags"])
+    run_git_quiet(repo, &["push", "origin", "main", "--tags"])
         .with_context(|| "Failed to push main with tags")?;
     Ok(())
 }
@@ -132,7 +178,37 @@ pub fn setup_draft_branch(repo: &Path) -> Result<()> {
     // Create or force-reset draft to match main — atomic, never conflicts.
     // This matches the pattern used in complete_session (git branch -f draft main).
     info!("Setting up draft branch (force-reset to main)...");
-    run_git(repo, &["checkout", "-B", "draft", "main"])
+    run_git_quiet(repo, &["checkout", "-B", "draft", "main"])
         .with_context(|| "Failed to create/reset draft branch")?;
     Ok(())
 }
+
+// ─── Tests ────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn porcelain_keeps_leading_space_of_first_record() {
+        let output = " M Review/current.md\0?? Chapters material/Chapter_02.md\0";
+        assert_eq!(
+            parse_porcelain_z(output),
+            vec!["Review/current.md", "Chapters material/Chapter_02.md"]
+        );
+    }
+
+    #[test]
+    fn porcelain_reports_rename_destination_only() {
+        let output = "R  Chapters material/Chapter_03.md\0old.md\0 M Lore.md\0";
+        assert_eq!(
+            parse_porcelain_z(output),
+            vec!["Chapters material/Chapter_03.md", "Lore.md"]
+        );
+    }
+
+    #[test]
+    fn porcelain_empty_output() {
+        assert!(parse_porcelain_z("").is_empty());
+    }
+}
@@ -335,10 +335,10 @@ pub fn run_seed(repo_path: &Path) -> Result<SeedPayload> {
         files_created.push(name.to_string());
     }
 
-    git::run_git(repo_path, &["add", "CLAUDE.md", "GEMINI.md"])?;
+    git::run_git_quiet(repo_path, &["add", "CLAUDE.md", "GEMINI.md"])?;
 
     // Only commit if there are staged changes (idempotent re-runs)
-    let nothing_staged = git::run_git(repo_path, &["diff", "--cached", "--quiet"]).is_ok();
+    let nothing_staged = git::run_git_quiet(repo_path, &["diff", "--cached", "--quiet"]).is_ok();
     if nothing_staged {
         return Ok(SeedPayload {
             status: "up_to_date",
@@ -346,7 +346,7 @@ pub fn run_seed(repo_path: &Path) -> Result<SeedPayload> {
         });
     }
 
-    git::run_git(
+    git::run_git_quiet(
         repo_path,
         &[
             "commit",
@@ -355,7 +355,7 @@ pub fn run_seed(repo_path: &Path) -> Result<SeedPayload> {
         ],
     )?;
 
-    if let Err(e) = git::run_git(repo_path, &["push", "origin", "main"]) {
+    if let Err(e) = git::run_git_quiet(repo_path, &["push", "origin", "main"]) {
         tracing::warn!("git push skipped: {}", e);
     }
 
@@ -401,7 +401,7 @@ pub fn run_reset(repo_path: &Path) -> Result<()> {
 
     // Remove all tracked content directories and files in one git rm call.
     // --ignore-unmatch silences errors for files that don't exist.
-    git::run_git(
+    git::run_git_quiet(
         repo_path,
         &[
             "rm",
@@ -433,8 +433,8 @@ pub fn run_reset(repo_path: &Path) -> Result<()> {
         fs::write(dir_path.join(".gitkeep"), "")?;
     }
 
-    git::run_git(repo_path, &["add", "-A"])?;
-    git::run_git(
+    git::run_git_quiet(repo_path, &["add", "-A"])?;
+    git::run_git_quiet(
         repo_path,
         &[
             "commit",
@@ -443,7 +443,7 @@ pub fn run_reset(repo_path: &Path) -> Result<()> {
         ],
     )?;
 
-    if let Err(e) = git::run_git(repo_path, &["push", "origin", "main"]) {
+    if let Err(e) = git::run_git_quiet(repo_path, &["push", "origin", "main"]) {
         tracing::warn!("git push skipped: {}", e);
     }
 
@@ -454,14 +454,14 @@ pub fn run_reset(repo_path: &Path) -> Result<()> {
 }
 
 fn git_commit_and_push(repo_path: &Path) -> Result<()> {
-    git::run_git(repo_path, &["add", "-A"])?;
-    git::run_git(
+    git::run_git_quiet(repo_path, &["add", "-A"])?;
+    git::run_git_quiet(
         repo_path,
         &["commit", "-m", "init: scaffold book repository"],
     )?;
 
     // Push is best-effort: skip if no remote is configured (common in local smoke tests)
-    if let Err(e) = git::run_git(repo_path, &["push", "origin", "main"]) {
+    if let Err(e) = git::run_git_quiet(repo_path, &["push", "origin", "main"]) {
         tracing::warn!("git push skipped: {}", e);
     }
 
@@ -798,8 +798,8 @@ fn write_answers_to_files(repo_path: &Path, answers: &[(usize, String)]) -> Resu
 }
 
 fn commit_qa_answers(repo_path: &Path) -> Result<()> {
-    git::run_git(repo_path, &["add", "-A"])?;
-    git::run_git(
+    git::run_git_quiet(repo_path, &["add", "-A"])?;
+    git::run_git_quiet(
         repo_path,
         &[
             "commit",
@@ -808,7 +808,7 @@ fn commit_qa_answers(repo_path: &Path) -> Result<()> {
         ],
     )?;
 
-    if let Err(e) = git::run_git(repo_path, &["push", "origin", "main"]) {
+    if let Err(e) = git::run_git_quiet(repo_path, &["push", "origin", "main"]) {
         tracing::warn!("git push skipped: {}", e);
     }
 
@@ -8,7 +8,7 @@ mod state;
 
 use anyhow::{Context, Result};
 use clap::{Parser, Subcommand};
-use std::io::Read;
+use std::io::{Read, Write};
 use std::path::PathBuf;
 use tracing_subscriber::{fmt, prelude::*, EnvFilter};
 
@@ -103,6 +103,17 @@ enum Commands {
     },
 }
 
+/// Write `value` to stdout as pretty JSON followed by a newline.
+/// Serializes straight into a buffered stdout handle instead of building the whole
+/// document as a String first — the session-open payload carries every context file.
+fn print_json<T: serde::Serialize>(value: &T) -> Result<()> {
+    let mut out = std::io::BufWriter::new(std::io::stdout().lock());
+    serde_json::to_writer_pretty(&mut out, value).context("Failed to write JSON to stdout")?;
+    writeln!(out)?;
+    out.flush()?;
+    Ok(())
+}
+
 fn main() -> Result<()> {
     // Initialize structured logging to stderr with env-filter
     tracing_subscriber::registry()
@@ -115,7 +126,7 @@ fn main() -> Result<()> {
     match cli.command {
         Commands::SessionOpen { repo_path } => {
             let payload = context::session_open(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&payload)?);
+            print_json(&payload)?;
         }
         Commands::SessionClose {
             repo_path,
@@ -128,11 +139,11 @@ fn main() -> Result<()> {
                 .context("Failed to read prose from stdin")?;
             let result =
                 maintenance::close_session(&repo_path, &prose, summary.as_deref(), &human_edits)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::Complete { repo_path } => {
             let result = maintenance::complete_session(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::Reset { repo_path } => {
             init::run_reset(&repo_path)?;
@@ -153,28 +164,28 @@ fn main() -> Result<()> {
                 init::run_interactive_qa(&repo_path, &result)?;
             } else {
                 // Called by agent, piped, or with --agent flag: output JSON payload
-                println!("{}", serde_json::to_string_pretty(&result)?);
+                print_json(&result)?;
             }
         }
         Commands::AdvanceChapter { repo_path } => {
             let result = maintenance::advance_chapter(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::Seed { repo_path } => {
             let result = init::run_seed(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::Status { repo_path } => {
             let result = maintenance::book_status(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::UpdateAgents { repo_path } => {
             let result = init::update_agents(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::Doctor { repo_path } => {
             let result = maintenance::doctor(&repo_path)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
         Commands::ApplyFormat { repo_path } => {
             let mut input = String::new();
@@ -183,7 +194,7 @@ fn main() -> Result<()> {
             let patch: serde_json::Value =
                 serde_json::from_str(&input).with_context(|| "Failed to parse patch JSON")?;
             let result = book::apply_format_patch(&repo_path, patch)?;
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            print_json(&result)?;
         }
     }
 
@@ -6,8 +6,8 @@ use std::path::Path;
 use tracing::info;
 
 use crate::book::{
-    append_to_full_book, check_full_book_format, count_prose_words, strip_author_ink_instructions,
-    strip_engine_markers,
+    append_to_full_book, check_full_book_format, count_prose_words_in_file,
+    strip_author_ink_instructions, strip_engine_markers,
 };
 use crate::config::Config;
 use crate::context::{extract_anchor, ink_re};
@@ -235,14 +235,7 @@ pub fn close_session(
         append_to_full_book(&book_path, validated.trim(), config.words_per_page)?
     } else {
         // Nothing validated: no words added; report current book word count
-        let existing = if book_path.exists() {
-            count_prose_words(
-                &std::fs::read_to_string(&book_path)
-                    .with_context(|| "Failed to read Full_Book.md")?,
-            )
-        } else {
-            0
-        };
+        let existing = count_prose_words_in_file(&book_path)?;
         (existing, existing)
     };
 
@@ -342,18 +335,20 @@ pub fn close_session(
 
     // ── Step 6: Commit and push ───────────────────────────────────────────────
     info!("Committing session on draft branch");
-    git::run_git(repo, &["rm", "-f", ".ink-running"])
-        .with_context(|| "Failed to git rm .ink-running")?;
-    git::run_git(repo, &["add", "-A"]).with_context(|| "Failed to git add session files")?;
-    git::run_git(repo, &["commit", "-m", "session: write prose"])
+    // Delete the lock on disk and let `add -A` stage the removal together with the
+    // session files — one git process instead of a separate `git rm`.
+    std::fs::remove_file(&lock_path).with_context(|| "Failed to remove .ink-running")?;
+    git::run_git_quiet(repo, &["add", "-A"]).with_context(|| "Failed to git add session files")?;
+    git::run_git_quiet(repo, &["commit", "-m", "session: write prose"])
         .with_context(|| "Failed to commit session files")?;
-    git::run_git(repo, &["push", "origin", "draft"]).with_context(|| "Failed to push draft")?;
+    git::run_git_quiet(repo, &["push", "origin", "draft"])
+        .with_context(|| "Failed to push draft")?;
 
     info!("Fast-forward merging draft into main and pushing");
-    git::run_git(repo, &["checkout", "main"]).with_context(|| "Failed to checkout main")?;
-    git::run_git(repo, &["merge", "--ff-only", "draft"])
+    git::run_git_quiet(repo, &["checkout", "main"]).with_context(|| "Failed to checkout main")?;
+    git::run_git_quiet(repo, &["merge", "--ff-only", "draft"])
         .with_context(|| "Failed to fast-forward merge draft into main")?;
-    git::run_git(repo, &["push", "origin", "main"]).with_context(|| "Failed to push main")?;
+    git::run_git_quiet(repo, &["push", "origin", "main"]).with_context(|| "Failed to push main")?;
 
     let completion_ready = total_word_count >= (config.target_length as f64 * 0.9) as u32;
 
@@ -383,7 +378,7 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
     }
 
     // Ensure we're on main
-    git::run_git(repo, &["checkout", "main"])
+    git::run_git_quiet(repo, &["checkout", "main"])
         .with_context(|| "Failed to checkout main for complete")?;
 
     // Read current.md
@@ -419,8 +414,11 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
         }));
     }
 
+    // Loaded once here and shared with the format check below.
+    let config = Config::load(repo)?;
+
     // Format check — ensure Full_Book.md has proper structure before sealing
-    if let Some(format_result) = check_full_book_format(repo)? {
+    if let Some(format_result) = check_full_book_format(repo, &config)? {
         return Ok(format_result);
     }
 
@@ -431,7 +429,6 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
     let current_content = strip_engine_markers(&stripped_content);
 
     // Append entire current.md to Full_Book.md (it's all validated at this point)
-    let config = Config::load(repo)?;
     let book_dir = repo.join("Current version");
     std::fs::create_dir_all(&book_dir).with_context(|| "Failed to create 'Current version/'")?;
     let book_path = book_dir.join("Full_Book.md");
@@ -440,12 +437,8 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
         let (_, new_total) =
             append_to_full_book(&book_path, &current_content, config.words_per_page)?;
         new_total
-    } else if book_path.exists() {
-        let content = std::fs::read_to_string(&book_path)
-            .with_context(|| "Failed to read Full_Book.md for word count")?;
-        count_prose_words(&content)
     } else {
-        0
+        count_prose_words_in_file(&book_path)?
     };
 
     // Write completion placeholder to current.md
@@ -454,11 +447,10 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
     std::fs::write(&current_md_path, placeholder)
         .with_context(|| "Failed to write completion placeholder to Review/current.md")?;
 
-    // Remove stale .ink-running lock if present
+    // Remove stale .ink-running lock if present — the final `add -A` stages the deletion
     let lock_path = repo.join(".ink-running");
     if lock_path.exists() {
-        git::run_git(repo, &["rm", "-f", ".ink-running"])
-            .with_context(|| "Failed to git rm .ink-running")?;
+        std::fs::remove_file(&lock_path).with_context(|| "Failed to remove .ink-running")?;
     }
 
     // Write COMPLETE marker
@@ -482,17 +474,17 @@ pub fn complete_session(repo: &Path) -> Result<serde_json::Value> {
     );
 
     // Commit and push main + draft so both branches reflect the sealed book
-    git::run_git(repo, &["add", "-A"]).with_context(|| "Failed to git add for final seal")?;
-    git::run_git(repo, &["commit", "-m", "book: complete — final seal"])
+    git::run_git_quiet(repo, &["add", "-A"]).with_context(|| "Failed to git add for final seal")?;
+    git::run_git_quiet(repo, &["commit", "-m", "book: complete — final seal"])
         .with_context(|| "Failed to commit completion")?;
-    git::run_git(repo, &["push", "origin", "main"])
+    git::run_git_quiet(repo, &["push", "origin", "main"])
         .with_context(|| "Failed to push main for completion")?;
 
     // Keep draft in sync — best-effort, not fatal if draft never existed
-    if git::run_git(repo, &["show-ref", "--verify", "refs/heads/draft"]).is_ok() {
-        git::run_git(repo, &["branch", "-f", "draft", "main"])
+    if git::run_git_quiet(repo, &["show-ref", "--verify", "refs/heads/draft"]).is_ok() {
+        git::run_git_quiet(repo, &["branch", "-f", "draft", "main"])
             .with_context(|| "Failed to fast-forward draft to main")?;
-        if let Err(e) = git::run_git(repo, &["push", "origin", "draft"]) {
+        if let Err(e) = git::run_git_quiet(repo, &["push", "origin", "draft"]) {
             tracing::warn!("Could not push draft after completion (non-fatal): {}", e);
         }
     }
@@ -563,8 +555,8 @@ pub fn advance_chapter(repo: &Path) -> Result<serde_json::Value> {
     if readme_exists {
         add_args.push("README.md");
     }
-    git::run_git(repo, &add_args).with_context(|| "Failed to git add for chapter advance")?;
-    git::run_git(
+    git::run_git_quiet(repo, &add_args).with_context(|| "Failed to git add for chapter advance")?;
+    git::run_git_quiet(
         repo,
         &[
             "commit",
@@ -593,13 +585,7 @@ pub fn book_status(repo: &Path) -> Result<serde_json::Value> {
     let config = Config::load(repo).ok();
 
     let book_path = repo.join("Current version").join("Full_Book.md");
-    let total_word_count = if book_path.exists() {
-        let content =
-            std::fs::read_to_string(&book_path).with_context(|| "Failed to read Full_Book.md")?;
-        count_prose_words(&content)
-    } else {
-        0
-    };
+    let total_word_count = count_prose_words_in_file(&book_path)?;
 
     let lock_path = repo.join(".ink-running");
     let lock_age_seconds = crate::context::read_lock_age(repo);
@@ -747,7 +733,7 @@ pub fn doctor(repo: &Path) -> Result<serde_json::Value> {
 
     // ── Git remote reachable (network call) ───────────────────────────────────
     if remote_url.is_ok() {
-        match git::run_git(repo, &["ls-remote", "--exit-code", "--heads", "origin"]) {
+        match git::run_git_quiet(repo, &["ls-remote", "--exit-code", "--heads", "origin"]) {
             Ok(_) => check!("git_remote_reachable", true, serde_json::Value::Null),
             Err(e) => check!(
                 "git_remote_reachable",
@@ -758,7 +744,8 @@ pub fn doctor(repo: &Path) -> Result<serde_json::Value> {
     }
 
     // ── Draft branch exists locally ───────────────────────────────────────────
-    let draft_exists = git::run_git(repo, &["show-ref", "--verify", "refs/heads/draft"]).is_ok();
+    let draft_exists =
+        git::run_git_quiet(repo, &["show-ref", "--verify", "refs/heads/draft"]).is_ok();
     check!(
         "draft_branch",
         draft_exists,
@@ -778,7 +765,7 @@ pub fn doctor(repo: &Path) -> Result<serde_json::Value> {
         let timeout = loaded_config
             .as_ref()
             .map(|c| c.session_timeout_minutes)
-            .unwrap_or(60);
+            .unwrap_or_else(|_| crate::config::default_session_timeout_minutes());
         let stale = age.map(|a| a > timeout).unwrap_or(false);
         check!(
             "session_lock",
@@ -841,21 +828,22 @@ pub fn rollback_session(repo_path: &Path) -> Result<()> {
     }
 
     // Ensure we're on main before resetting
-    git::run_git(repo_path, &["checkout", "main"]).with_context(|| "Failed to checkout main")?;
+    git::run_git_quiet(repo_path, &["checkout", "main"])
+        .with_context(|| "Failed to checkout main")?;
 
     // Hard reset main to the snapshot tag
-    git::run_git(repo_path, &["reset", "--hard", target])
+    git::run_git_quiet(repo_path, &["reset", "--hard", target])
         .with_context(|| format!("Failed to reset to {}", target))?;
 
     // Force-push main
-    git::run_git(repo_path, &["push", "--force", "origin", "main"])
+    git::run_git_quiet(repo_path, &["push", "--force", "origin", "main"])
         .with_context(|| "Failed to force-push main")?;
 
     // Reset draft to main if it exists
-    if git::run_git(repo_path, &["show-ref", "--verify", "refs/heads/draft"]).is_ok() {
-        git::run_git(repo_path, &["branch", "-f", "draft", "main"])
+    if git::run_git_quiet(repo_path, &["show-ref", "--verify", "refs/heads/draft"]).is_ok() {
+        git::run_git_quiet(repo_path, &["branch", "-f", "draft", "main"])
             .with_context(|| "Failed to reset draft branch")?;
-        git::run_git(repo_path, &["push", "--force", "origin", "draft"])
+        git::run_git_quiet(repo_path, &["push", "--force", "origin", "draft"])
             .with_context(|| "Failed to force-push draft")?;
     }
 